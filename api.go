@@ -281,7 +281,7 @@ func (s *APIServer) getLatestArticles(w http.ResponseWriter, r *http.Request) {
 	query := `
 		SELECT title, url, full_content, publish_date, fetch_time, fetch_duration_ms, feed_url, content_hash
 		FROM articles
-		ORDER BY fetched_at DESC 
+		ORDER BY fetch_time DESC
 		LIMIT $1`
 
 	rows, err := s.db.Query(query, limit)
@@ -583,9 +583,9 @@ func (s *APIServer) getSummarizationStats(w http.ResponseWriter, r *http.Request
 	// Add database-based summarization statistics
 	summaryStats := make(map[string]interface{})
 
-	// Get total summaries processed
+	// Get total summaries processed, including ones served from summary_cache
 	var totalSummaries int
-	err := s.db.QueryRow("SELECT COUNT(*) FROM summary_logs WHERE status = 'success'").Scan(&totalSummaries)
+	err := s.db.QueryRow("SELECT COUNT(*) FROM summary_logs WHERE status IN ('success', 'cached')").Scan(&totalSummaries)
 	if err != nil {
 		log.Printf("Error getting total summaries: %v", err)
 	} else {
@@ -604,7 +604,8 @@ func (s *APIServer) getSummarizationStats(w http.ResponseWriter, r *http.Request
 		summaryStats["failed_summaries_24h"] = failedSummaries24h
 	}
 
-	// Get average processing time
+	// Get average processing time of Ollama calls; cache hits ('cached')
+	// are left out so they don't mask model latency
 	var avgProcessingTime *float64
 	err = s.db.QueryRow(`
 		SELECT AVG(duration_ms) FROM summary_logs
@@ -78,7 +78,7 @@ func TestArticleDateFiltering(t *testing.T) {
 				PublishedParsed: tt.publishDate,
 			}
 
-			// Test the date filtering logic (extracted from processArticle)
+			// Test the date filtering logic (extracted from admitArticle)
 			result := shouldProcessArticle(item, cfg)
 
 			if result != tt.expectedResult {
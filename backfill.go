@@ -3,6 +3,7 @@ package main
 import (
 	"database/sql"
 	"fmt"
+	"io"
 	"log"
 	"net/http"
 	"strings"
@@ -85,7 +86,7 @@ func backfillFetch(client *http.Client, ua, url string, maxLen int) (string, err
 	if resp.StatusCode != http.StatusOK {
 		return "", fmt.Errorf("HTTP %d", resp.StatusCode)
 	}
-	doc, err := goquery.NewDocumentFromReader(resp.Body)
+	doc, err := goquery.NewDocumentFromReader(io.LimitReader(resp.Body, maxArticleHTMLBytes))
 	if err != nil {
 		return "", err
 	}
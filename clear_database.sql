@@ -5,6 +5,7 @@
 DELETE FROM webhook_logs;
 DELETE FROM discord_error_logs;
 DELETE FROM summary_logs;
+DELETE FROM summary_cache;
 DELETE FROM articles;
 
 -- Reset the sequence counters to start from 1
@@ -31,6 +31,23 @@ type DatabaseConfig struct {
 	User     string
 	Password string
 	Name     string
+
+	// Connection pool limits applied to the shared *sql.DB. database/sql keeps
+	// only 2 idle connections by default, so concurrent feed writers otherwise
+	// reconnect (TCP + auth) on almost every statement.
+	MaxOpenConns    int
+	MaxIdleConns    int
+	ConnMaxLifetime time.Duration
+
+	// SynchronousCommit is sent as the session's synchronous_commit setting on
+	// every pooled connection; empty (the default) leaves the server default.
+	// "off" stops each COMMIT waiting for its WAL flush. A server crash then
+	// never corrupts data, but can lose the last few hundred milliseconds of
+	// commits from every writer: articles (re-fetched next cycle), summaries,
+	// webhook and fetch logs, and posted_to_discord updates — a lost one of
+	// those re-posts the article to Discord. Only values in
+	// synchronousCommitValues are accepted.
+	SynchronousCommit string
 }
 
 // AppConfig holds general application configuration
@@ -55,6 +72,10 @@ type APIConfig struct {
 type FlareSolverrConfig struct {
 	URL     string
 	Timeout time.Duration
+	// MaxIdleSessions caps how many FlareSolverr sessions are kept open
+	// between requests. Each one is a resident headless Chrome; 0 disables
+	// session reuse and launches a one-off browser per request.
+	MaxIdleSessions int
 }
 
 // OLLAMAConfig holds OLLAMA AI service configuration
@@ -63,6 +84,9 @@ type OLLAMAConfig struct {
 	Model      string
 	Timeout    time.Duration
 	MaxRetries int
+	// KeepAlive is how long Ollama keeps the summarization model loaded after
+	// each request; negative keeps it loaded indefinitely.
+	KeepAlive time.Duration
 }
 
 // DiscordConfig holds Discord webhook configuration
@@ -88,11 +112,14 @@ type SecurityConfig struct {
 
 // PerformanceConfig holds performance-related configuration
 type PerformanceConfig struct {
-	MaxConcurrentFeeds      int
-	MaxArticleContentLength int
-	HTTPReadTimeout         time.Duration
-	HTTPWriteTimeout        time.Duration
-	HTTPIdleTimeout         time.Duration
+	MaxConcurrentFeeds int
+	// MaxConcurrentArticleFetches bounds the full-content fetches running at
+	// once within a single feed (so up to MaxConcurrentFeeds times this overall).
+	MaxConcurrentArticleFetches int
+	MaxArticleContentLength     int
+	HTTPReadTimeout             time.Duration
+	HTTPWriteTimeout            time.Duration
+	HTTPIdleTimeout             time.Duration
 }
 
 // ContentConfig holds content processing configuration
@@ -104,6 +131,7 @@ type ContentConfig struct {
 // SummarizationConfig holds summarization scheduler configuration
 type SummarizationConfig struct {
 	MaxQueueSize      int
+	Workers           int
 	WorkerTimeout     time.Duration
 	MaxRetries        int
 	RetryBackoffBase  time.Duration
@@ -129,6 +157,11 @@ func Load() *Config {
 			User:     getEnv("DB_USER", "postgres"),
 			Password: getEnv("DB_PASSWORD", "postgres"),
 			Name:     getEnv("DB_NAME", "information_broker"),
+
+			MaxOpenConns:      getEnvInt("DB_MAX_OPEN_CONNS", 25),
+			MaxIdleConns:      getEnvInt("DB_MAX_IDLE_CONNS", 10),
+			ConnMaxLifetime:   getEnvDuration("DB_CONN_MAX_LIFETIME", 30*time.Minute),
+			SynchronousCommit: getEnvChoice("DB_SYNCHRONOUS_COMMIT", "", synchronousCommitValues),
 		},
 		App: AppConfig{
 			Port:              getEnvInt("APP_PORT", 8080),
@@ -143,14 +176,16 @@ func Load() *Config {
 			UserAgent: getEnv("API_USER_AGENT", "Information-Broker/1.0"),
 		},
 		FlareSolverr: FlareSolverrConfig{
-			URL:     getEnv("FLARESOLVERR_URL", ""),
-			Timeout: getEnvDuration("FLARESOLVERR_TIMEOUT", 60*time.Second),
+			URL:             getEnv("FLARESOLVERR_URL", ""),
+			Timeout:         getEnvDuration("FLARESOLVERR_TIMEOUT", 60*time.Second),
+			MaxIdleSessions: getEnvInt("FLARESOLVERR_MAX_IDLE_SESSIONS", 2),
 		},
 		OLLAMA: OLLAMAConfig{
 			URL:        getEnv("OLLAMA_URL", "http://localhost:11434"),
 			Model:      getEnv("OLLAMA_MODEL", "llama2"),
 			Timeout:    getEnvDuration("OLLAMA_TIMEOUT", 60*time.Second),
 			MaxRetries: getEnvInt("OLLAMA_MAX_RETRIES", 3),
+			KeepAlive:  getEnvDuration("OLLAMA_KEEP_ALIVE", -1),
 		},
 		Discord: DiscordConfig{
 			WebhookURL:    getEnv("DISCORD_WEBHOOK_URL", ""),
@@ -168,11 +203,12 @@ func Load() *Config {
 			CORSAllowedHeaders: getEnv("CORS_ALLOWED_HEADERS", "Content-Type,Authorization"),
 		},
 		Performance: PerformanceConfig{
-			MaxConcurrentFeeds:      getEnvInt("MAX_CONCURRENT_FEEDS", 10),
-			MaxArticleContentLength: getEnvInt("MAX_ARTICLE_CONTENT_LENGTH", 10000),
-			HTTPReadTimeout:         getEnvDuration("HTTP_READ_TIMEOUT", 15*time.Second),
-			HTTPWriteTimeout:        getEnvDuration("HTTP_WRITE_TIMEOUT", 15*time.Second),
-			HTTPIdleTimeout:         getEnvDuration("HTTP_IDLE_TIMEOUT", 60*time.Second),
+			MaxConcurrentFeeds:          getEnvInt("MAX_CONCURRENT_FEEDS", 10),
+			MaxConcurrentArticleFetches: getEnvInt("MAX_CONCURRENT_ARTICLE_FETCHES", 4),
+			MaxArticleContentLength:     getEnvInt("MAX_ARTICLE_CONTENT_LENGTH", 10000),
+			HTTPReadTimeout:             getEnvDuration("HTTP_READ_TIMEOUT", 15*time.Second),
+			HTTPWriteTimeout:            getEnvDuration("HTTP_WRITE_TIMEOUT", 15*time.Second),
+			HTTPIdleTimeout:             getEnvDuration("HTTP_IDLE_TIMEOUT", 60*time.Second),
 		},
 		Content: ContentConfig{
 			MaxSummaryLength:     getEnvInt("MAX_SUMMARY_LENGTH", 200),
@@ -180,6 +216,7 @@ func Load() *Config {
 		},
 		Summarization: SummarizationConfig{
 			MaxQueueSize:      getEnvInt("SUMMARIZATION_MAX_QUEUE_SIZE", 100),
+			Workers:           getEnvInt("SUMMARIZATION_WORKERS", 1),
 			WorkerTimeout:     getEnvDuration("SUMMARIZATION_WORKER_TIMEOUT", 120*time.Second),
 			MaxRetries:        getEnvInt("SUMMARIZATION_MAX_RETRIES", 3),
 			RetryBackoffBase:  getEnvDuration("SUMMARIZATION_RETRY_BACKOFF_BASE", 1*time.Second),
@@ -231,6 +268,15 @@ func getEnvDuration(key string, defaultValue time.Duration) time.Duration {
 	return defaultValue
 }
 
+// getEnvChoice returns the variable's value if it is one of allowed, and
+// defaultValue otherwise.
+func getEnvChoice(key, defaultValue string, allowed map[string]bool) string {
+	if value := os.Getenv(key); allowed[value] {
+		return value
+	}
+	return defaultValue
+}
+
 func getEnvStringSlice(key string, defaultValue []string) []string {
 	if value := os.Getenv(key); value != "" {
 		// Split by comma and trim whitespace
@@ -298,8 +344,21 @@ func (d *DiscordConfig) IsFeedExcluded(feedURL string) bool {
 	return false
 }
 
+// synchronousCommitValues are the synchronous_commit settings PostgreSQL accepts.
+var synchronousCommitValues = map[string]bool{
+	"on": true, "off": true, "local": true, "remote_write": true, "remote_apply": true,
+}
+
 // GetConnectionString returns the database connection string
 func (c *Config) GetConnectionString() string {
-	return fmt.Sprintf("host=%s port=%s user=%s password=%s dbname=%s sslmode=disable",
+	connStr := fmt.Sprintf("host=%s port=%s user=%s password=%s dbname=%s sslmode=disable",
 		c.Database.Host, c.Database.Port, c.Database.User, c.Database.Password, c.Database.Name)
+
+	// lib/pq forwards unrecognised keys as run-time parameters in the startup
+	// packet, so this applies to every pooled connection as it is opened.
+	// Only known values are appended, so the setting can't inject other keys.
+	if synchronousCommitValues[c.Database.SynchronousCommit] {
+		connStr += " synchronous_commit=" + c.Database.SynchronousCommit
+	}
+	return connStr
 }
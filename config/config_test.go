@@ -69,3 +69,43 @@ func TestIsFeedExcluded(t *testing.T) {
 		})
 	}
 }
+
+func TestGetConnectionString(t *testing.T) {
+	cfg := &Config{Database: DatabaseConfig{
+		Host: "db", Port: "5432", User: "u", Password: "p", Name: "n",
+	}}
+
+	base := "host=db port=5432 user=u password=p dbname=n sslmode=disable"
+	if got := cfg.GetConnectionString(); got != base {
+		t.Errorf("GetConnectionString() = %q, want %q", got, base)
+	}
+
+	cfg.Database.SynchronousCommit = "off"
+	if got, want := cfg.GetConnectionString(), base+" synchronous_commit=off"; got != want {
+		t.Errorf("GetConnectionString() = %q, want %q", got, want)
+	}
+
+	cfg.Database.SynchronousCommit = "off sslmode=require"
+	if got := cfg.GetConnectionString(); got != base {
+		t.Errorf("GetConnectionString() with invalid synchronous_commit = %q, want %q", got, base)
+	}
+}
+
+func TestLoadSynchronousCommit(t *testing.T) {
+	tests := []struct {
+		env  string
+		want string
+	}{
+		{"", ""},
+		{"off", "off"},
+		{"remote_apply", "remote_apply"},
+		{"OFF", ""},
+		{"off password=x", ""},
+	}
+	for _, tt := range tests {
+		t.Setenv("DB_SYNCHRONOUS_COMMIT", tt.env)
+		if got := Load().Database.SynchronousCommit; got != tt.want {
+			t.Errorf("DB_SYNCHRONOUS_COMMIT=%q: SynchronousCommit = %q, want %q", tt.env, got, tt.want)
+		}
+	}
+}
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"log"
 	"net/http"
+	"sort"
 	"time"
 )
 
@@ -101,6 +102,11 @@ const minCrossFeedCountForImportant = 2
 // recently" -- the frontend lists them separately via splitUpcoming. The
 // count subquery is deliberately left unbounded: a future-dated sibling
 // still evidences that a story is being covered.
+//
+// There is no ORDER BY: cross_feed_count comes out of the join, so no index
+// can supply that order, and PostgreSQL would have to sort the full joined
+// rows -- full_content included -- which spills to disk on the longer ranges.
+// The handler orders the scanned rows with sortDigestRows instead.
 func buildDigestQuery(since, countSince time.Time) (string, []interface{}) {
 	query := `SELECT a.id, a.title, a.url, a.summary, a.full_content, a.publish_date,
 		a.fetch_duration_ms, a.feed_url, a.content_hash,
@@ -112,13 +118,23 @@ func buildDigestQuery(since, countSince time.Time) (string, []interface{}) {
 			WHERE publish_date >= $2 AND story_cluster_id IS NOT NULL
 			GROUP BY story_cluster_id
 		) cluster_counts ON cluster_counts.story_cluster_id = a.story_cluster_id
-		WHERE a.publish_date >= $1 AND a.publish_date <= now()
-		ORDER BY cross_feed_count DESC, a.publish_date DESC`
+		WHERE a.publish_date >= $1 AND a.publish_date <= now()`
 	return query, []interface{}{since, countSince}
 }
 
+// sortDigestRows orders digest rows most-corroborated first, newest first
+// within equal coverage -- the order splitImportant expects.
+func sortDigestRows(rows []ArticleView) {
+	sort.SliceStable(rows, func(i, j int) bool {
+		if rows[i].CrossFeedCount != rows[j].CrossFeedCount {
+			return rows[i].CrossFeedCount > rows[j].CrossFeedCount
+		}
+		return rows[i].PublishedAt.After(rows[j].PublishedAt)
+	})
+}
+
 // splitImportant partitions digest rows into important (>= minCrossFeedCountForImportant
-// other feeds) and everything else, preserving the query's incoming order in both groups.
+// other feeds) and everything else, preserving the incoming (sortDigestRows) order in both groups.
 func splitImportant(rows []ArticleView) (important, other []ArticleView) {
 	important = []ArticleView{}
 	other = []ArticleView{}
@@ -193,6 +209,7 @@ func (s *APIServer) getArticlesDigest(w http.ResponseWriter, r *http.Request) {
 		all = append(all, a)
 	}
 
+	sortDigestRows(all)
 	important, other := splitImportant(all)
 	w.Header().Set("Content-Type", "application/json")
 	json.NewEncoder(w).Encode(DigestResult{
@@ -87,13 +87,27 @@ func NewDiscordWebhookSender(db *sql.DB, metrics *PrometheusMetrics) *DiscordWeb
 	return &DiscordWebhookSender{
 		db: db,
 		httpClient: &http.Client{
-			Timeout: 30 * time.Second,
+			Timeout:   30 * time.Second,
+			Transport: discordTransport(),
 		},
 		maxRetries: 2, // Retry twice as specified
 		metrics:    metrics,
 	}
 }
 
+// discordMaxIdleConnsPerHost covers one pooled connection per configured
+// webhook. Every webhook URL is on discord.com, and a notification posts to all
+// of them at once; http.DefaultTransport keeps only two idle connections per
+// host, so every webhook past the second paid a fresh TLS handshake per article.
+const discordMaxIdleConnsPerHost = 16
+
+// discordTransport returns the HTTP transport shared by all webhook calls.
+func discordTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConnsPerHost = discordMaxIdleConnsPerHost
+	return t
+}
+
 // SendArticleToDiscord sends a formatted article message to Discord webhook with embeds
 func (d *DiscordWebhookSender) SendArticleToDiscord(ctx context.Context, webhookURL string, article ArticleMessage) error {
 	startTime := time.Now()
@@ -111,8 +125,20 @@ func (d *DiscordWebhookSender) SendArticleToDiscord(ctx context.Context, webhook
 		return fmt.Errorf("article URL cannot be empty")
 	}
 
-	// Create the Discord message with embed
-	message := d.createDiscordMessage(article)
+	// Create and encode the Discord message with embed once; every attempt
+	// posts the same bytes. An oversized message can't succeed on retry.
+	payload, err := encodeDiscordMessage(d.createDiscordMessage(article))
+	if err != nil {
+		d.metrics.RecordDiscordWebhookError("invalid_message")
+		d.logDiscordError(DiscordErrorLog{
+			WebhookURL:   d.sanitizeWebhookURL(webhookURL),
+			ArticleURL:   article.URL,
+			ErrorMessage: err.Error(),
+			Duration:     time.Since(startTime),
+			CreatedAt:    time.Now(),
+		})
+		return err
+	}
 
 	var lastErr error
 
@@ -120,7 +146,7 @@ func (d *DiscordWebhookSender) SendArticleToDiscord(ctx context.Context, webhook
 	for attempt := 1; attempt <= d.maxRetries+1; attempt++ { // +1 for initial attempt
 		attemptStart := time.Now()
 
-		err := d.sendWebhookMessage(ctx, webhookURL, message)
+		err := d.sendWebhookMessage(ctx, webhookURL, payload)
 		attemptDuration := time.Since(attemptStart)
 
 		if err == nil {
@@ -227,21 +253,26 @@ func (d *DiscordWebhookSender) createDiscordMessage(article ArticleMessage) Disc
 	return message
 }
 
-// sendWebhookMessage sends the actual HTTP request to Discord
-func (d *DiscordWebhookSender) sendWebhookMessage(ctx context.Context, webhookURL string, message DiscordWebhookMessage) error {
+// encodeDiscordMessage marshals a message to the JSON body of a webhook call.
+func encodeDiscordMessage(message DiscordWebhookMessage) ([]byte, error) {
 	// Marshal the message to JSON
 	jsonData, err := json.Marshal(message)
 	if err != nil {
-		return fmt.Errorf("failed to marshal Discord message: %w", err)
+		return nil, fmt.Errorf("failed to marshal Discord message: %w", err)
 	}
 
 	// Verify total message size doesn't exceed Discord's limits
 	if len(jsonData) > 2000 {
-		return fmt.Errorf("message too large: %d characters (Discord limit: 2000)", len(jsonData))
+		return nil, fmt.Errorf("message too large: %d characters (Discord limit: 2000)", len(jsonData))
 	}
 
+	return jsonData, nil
+}
+
+// sendWebhookMessage sends the actual HTTP request to Discord
+func (d *DiscordWebhookSender) sendWebhookMessage(ctx context.Context, webhookURL string, payload []byte) error {
 	// Create HTTP request
-	req, err := http.NewRequestWithContext(ctx, "POST", webhookURL, bytes.NewBuffer(jsonData))
+	req, err := http.NewRequestWithContext(ctx, "POST", webhookURL, bytes.NewReader(payload))
 	if err != nil {
 		return fmt.Errorf("failed to create HTTP request: %w", err)
 	}
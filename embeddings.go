@@ -64,7 +64,7 @@ func fetchEmbedding(ctx context.Context, httpClient *http.Client, ollamaURL, mod
 	if err != nil {
 		return nil, fmt.Errorf("embed request failed: %w", err)
 	}
-	defer resp.Body.Close()
+	defer drainAndClose(resp.Body)
 
 	if resp.StatusCode != http.StatusOK {
 		return nil, fmt.Errorf("embed request returned status %d", resp.StatusCode)
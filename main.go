@@ -172,6 +172,7 @@ func main() {
 
 	cancel()
 	wg.Wait()
+	monitor.Close()
 	log.Println("All services stopped successfully")
 }
 
@@ -206,6 +207,12 @@ func initDatabase(cfg *config.Config) (*sql.DB, error) {
 		return nil, err
 	}
 
+	// Size the pool for the concurrent feed fetchers plus the API server and
+	// schedulers instead of database/sql's default of 2 idle connections.
+	db.SetMaxOpenConns(cfg.Database.MaxOpenConns)
+	db.SetMaxIdleConns(cfg.Database.MaxIdleConns)
+	db.SetConnMaxLifetime(cfg.Database.ConnMaxLifetime)
+
 	// Test connection
 	if err := db.Ping(); err != nil {
 		return nil, fmt.Errorf("failed to ping database: %v", err)
@@ -264,6 +271,9 @@ func createTables(db *sql.DB) error {
 		`CREATE INDEX IF NOT EXISTS idx_articles_feed_url ON articles(feed_url)`,
 		`CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at DESC)`,
 		`CREATE INDEX IF NOT EXISTS idx_articles_updated_at ON articles(updated_at DESC)`,
+		// Serves /articles?feed= (ORDER BY publish_date) straight from the index.
+		// Same name as in schema.sql, so Docker deployments don't get a duplicate.
+		`CREATE INDEX IF NOT EXISTS idx_articles_feed_publish ON articles(feed_url, publish_date DESC)`,
 		// Trigram indexes back the /articles?q= ILIKE search (title/summary/full_content).
 		`CREATE EXTENSION IF NOT EXISTS pg_trgm`,
 		`CREATE INDEX IF NOT EXISTS idx_articles_title_trgm ON articles USING GIN (title gin_trgm_ops)`,
@@ -7,6 +7,7 @@ import (
 	"database/sql"
 	"encoding/hex"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"information-broker/config"
 	"io"
@@ -16,10 +17,14 @@ import (
 	"sort"
 	"strings"
 	"sync"
+	"syscall"
 	"time"
 
 	"github.com/PuerkitoBio/goquery"
+	"github.com/andybalholm/cascadia"
+	"github.com/lib/pq"
 	"github.com/mmcdole/gofeed"
+	"golang.org/x/net/html"
 )
 
 // Article represents a fetched article with all required information
@@ -41,16 +46,26 @@ type RSSMonitor struct {
 	mutex           sync.RWMutex
 	fetchInterval   time.Duration
 	httpClient      *http.Client
-	parser          *gofeed.Parser
+	flareClient     *http.Client
+	flareSessions   chan string // idle FlareSolverr sessions, see acquireFlareSession
 	metrics         *PrometheusMetrics
 	config          *config.Config
 	circuitBreakers *CircuitBreakerManager
 	scheduler       *SummarizationScheduler
+
+	// Prepared statements for the per-article/per-feed hot path, keyed by
+	// query text. See prepare.
+	stmtMu sync.Mutex
+	stmts  map[string]*sql.Stmt
+
+	// fetch_logs rows queued for the background writer, see logFetch
+	fetchLogs    chan fetchLogEntry
+	fetchLogDone chan struct{}
 }
 
 // NewRSSMonitor creates a new RSS monitor instance
 func NewRSSMonitor(db *sql.DB, feeds []string, metrics *PrometheusMetrics, cfg *config.Config, circuitBreakers *CircuitBreakerManager, scheduler *SummarizationScheduler) *RSSMonitor {
-	return &RSSMonitor{
+	m := &RSSMonitor{
 		db:            db,
 		feeds:         feeds,
 		seenArticles:  make(map[string]bool),
@@ -68,11 +83,67 @@ func NewRSSMonitor(db *sql.DB, feeds []string, metrics *PrometheusMetrics, cfg *
 				}).DialContext,
 			},
 		},
-		parser:          gofeed.NewParser(),
+		// One client for every FlareSolverr call, so the connection to the
+		// solver is kept alive between retries instead of re-dialled each time.
+		// Allows the solver its full maxTimeout plus headroom for browser startup.
+		flareClient:     &http.Client{Timeout: cfg.FlareSolverr.Timeout + 30*time.Second},
+		flareSessions:   make(chan string, max(cfg.FlareSolverr.MaxIdleSessions, 0)),
 		metrics:         metrics,
 		config:          cfg,
 		circuitBreakers: circuitBreakers,
 		scheduler:       scheduler,
+		stmts:           make(map[string]*sql.Stmt),
+		fetchLogs:       make(chan fetchLogEntry, fetchLogQueueSize),
+		fetchLogDone:    make(chan struct{}),
+	}
+	go m.fetchLogWriter()
+	return m
+}
+
+// prepare returns the cached prepared statement for query, preparing it on
+// first use. Reusing one statement skips PostgreSQL's parse/plan step on every
+// article and fetch-log insert. database/sql re-prepares it transparently on
+// each pooled connection the first time it runs there. A failed prepare is not
+// cached, so the next call tries again.
+func (m *RSSMonitor) prepare(query string) (*sql.Stmt, error) {
+	m.stmtMu.Lock()
+	defer m.stmtMu.Unlock()
+
+	if stmt, ok := m.stmts[query]; ok {
+		return stmt, nil
+	}
+	stmt, err := m.db.Prepare(query)
+	if err != nil {
+		return nil, fmt.Errorf("failed to prepare statement: %w", err)
+	}
+	m.stmts[query] = stmt
+	return stmt, nil
+}
+
+// Close flushes queued fetch logs, destroys the monitor's pooled FlareSolverr
+// sessions and releases its prepared statements. Call it once the monitor has
+// stopped, before the database is closed.
+func (m *RSSMonitor) Close() {
+	close(m.fetchLogs)
+	<-m.fetchLogDone
+
+	for drained := false; !drained; {
+		select {
+		case session := <-m.flareSessions:
+			m.destroyFlareSession(session)
+		default:
+			drained = true
+		}
+	}
+
+	m.stmtMu.Lock()
+	defer m.stmtMu.Unlock()
+
+	for query, stmt := range m.stmts {
+		if err := stmt.Close(); err != nil {
+			log.Printf("Failed to close prepared statement: %v", err)
+		}
+		delete(m.stmts, query)
 	}
 }
 
@@ -217,9 +288,9 @@ func (m *RSSMonitor) doFetchFeed(ctx context.Context, feedURL string, startTime
 		// transport layer (TLS handshake, HTTP/2 RST_STREAM, connection reset)
 		// instead of returning 403, so the status-code check below never runs.
 		// Retry through the challenge solver before giving up, unless we are
-		// shutting down (context cancelled/expired), in which case a retry is
-		// pointless.
-		if m.config.FlareSolverr.URL != "" && ctx.Err() == nil {
+		// shutting down (context cancelled/expired) or the failure is one a
+		// browser can't get past either, in which case a retry is pointless.
+		if m.config.FlareSolverr.URL != "" && ctx.Err() == nil && isSolvableTransportError(err) {
 			return m.fetchViaFlareSolverr(ctx, feedURL, startTime)
 		}
 		duration := time.Since(startTime)
@@ -228,7 +299,7 @@ func (m *RSSMonitor) doFetchFeed(ctx context.Context, feedURL string, startTime
 		m.metrics.RecordRSSFetchError(feedURL, "http_request_failed")
 		return err
 	}
-	defer resp.Body.Close()
+	defer drainAndClose(resp.Body)
 
 	if resp.StatusCode != http.StatusOK {
 		// Cloudflare and similar WAFs answer with a challenge status (403, and
@@ -246,8 +317,11 @@ func (m *RSSMonitor) doFetchFeed(ctx context.Context, feedURL string, startTime
 		return err
 	}
 
-	// Parse the feed
-	feed, err := m.parser.Parse(resp.Body)
+	// Parse the feed straight off the response body. gofeed's pull parser
+	// streams the XML rather than buffering it, but a gofeed.Parser keeps
+	// per-document state while it runs and is not safe for concurrent use —
+	// feeds are fetched in parallel, so each fetch gets its own.
+	feed, err := gofeed.NewParser().Parse(resp.Body)
 	if err != nil {
 		duration := time.Since(startTime)
 		m.logFetch(feedURL, "error", fmt.Sprintf("Failed to parse feed: %v", err), duration, 0, 0)
@@ -273,54 +347,92 @@ func isChallengeStatus(code int) bool {
 	return code >= 520 && code <= 527
 }
 
-// processFeedItems sorts and processes a parsed feed's items and records success
-// metrics. It is shared by the direct fetch path and the FlareSolverr fallback.
-func (m *RSSMonitor) processFeedItems(ctx context.Context, feedURL string, feed *gofeed.Feed, startTime time.Time) error {
-	// Process articles
-	newArticles := 0
-	totalArticles := len(feed.Items)
-
-	// Sort articles by publication date (oldest first) to maintain chronological order
-	sortedItems := make([]*gofeed.Item, len(feed.Items))
-	copy(sortedItems, feed.Items)
+// maxDrainBytes bounds how much of an unread response body drainAndClose will
+// discard to keep its connection; anything larger is cheaper to just close.
+const maxDrainBytes = 64 << 10
+
+// drainAndClose discards up to maxDrainBytes of a response body before closing
+// it. net/http only returns a keep-alive connection to the idle pool once its
+// body has been read to EOF. A non-200 response closed unread (a WAF 403, a 404
+// article) therefore cost a fresh TCP+TLS handshake on the next request to the
+// same host.
+func drainAndClose(body io.ReadCloser) {
+	io.Copy(io.Discard, io.LimitReader(body, maxDrainBytes))
+	body.Close()
+}
 
-	sort.Slice(sortedItems, func(i, j int) bool {
-		// Handle cases where PublishedParsed might be nil
-		timeI := time.Time{}
-		timeJ := time.Time{}
+// isSolvableTransportError reports whether a transport-level fetch failure
+// could be a WAF block that FlareSolverr might get past (TLS handshake
+// failure, reset connection, HTTP/2 stream error, …). It returns false for
+// failures that mean the host itself is unreachable. When a name doesn't
+// resolve or nothing listens on the port, the headless browser fails the same
+// way, only after spending up to FlareSolverr.Timeout starting Chrome to
+// discover it.
+func isSolvableTransportError(err error) bool {
+	var dnsErr *net.DNSError
+	if errors.As(err, &dnsErr) {
+		return false
+	}
+	if errors.Is(err, syscall.ECONNREFUSED) || errors.Is(err, syscall.EHOSTUNREACH) || errors.Is(err, syscall.ENETUNREACH) {
+		return false
+	}
+	return true
+}
 
-		if sortedItems[i].PublishedParsed != nil {
-			timeI = *sortedItems[i].PublishedParsed
-		}
-		if sortedItems[j].PublishedParsed != nil {
-			timeJ = *sortedItems[j].PublishedParsed
-		}
+// sortItemsByPublishDate returns a copy of items ordered oldest first. Items
+// without a parsed publish date go last. The sort is stable, so undated items
+// and items sharing a timestamp keep their feed order.
+func sortItemsByPublishDate(items []*gofeed.Item) []*gofeed.Item {
+	sorted := make([]*gofeed.Item, len(items))
+	copy(sorted, items)
 
-		// If both times are zero (nil), maintain original order
-		if timeI.IsZero() && timeJ.IsZero() {
-			return i < j
-		}
-		// If one is zero, put the non-zero one first
-		if timeI.IsZero() {
+	sort.SliceStable(sorted, func(i, j int) bool {
+		timeI, timeJ := sorted[i].PublishedParsed, sorted[j].PublishedParsed
+		if timeI == nil || timeI.IsZero() {
 			return false
 		}
-		if timeJ.IsZero() {
+		if timeJ == nil || timeJ.IsZero() {
 			return true
 		}
-
-		// Both have valid times, sort chronologically (oldest first)
-		return timeI.Before(timeJ)
+		return timeI.Before(*timeJ)
 	})
+	return sorted
+}
+
+// processFeedItems sorts and processes a parsed feed's items and records success
+// metrics. It is shared by the direct fetch path and the FlareSolverr fallback.
+func (m *RSSMonitor) processFeedItems(ctx context.Context, feedURL string, feed *gofeed.Feed, startTime time.Time) error {
+	// Process articles
+	totalArticles := len(feed.Items)
 
+	// Sort articles by publication date (oldest first) to maintain chronological order
+	sortedItems := sortItemsByPublishDate(feed.Items)
+
+	// One query for the whole feed instead of discovering already-stored
+	// articles one expensive full-content fetch at a time.
+	m.markStoredArticles(ctx, feedURL, sortedItems)
+
+	// Filter serially -- it is cheap and keeps the seen-set check-and-set in
+	// feed order -- then fetch the admitted articles' full content concurrently.
+	var admitted []admittedItem
 	for _, item := range sortedItems {
 		if ctx.Err() != nil {
-			return ctx.Err() // Context cancelled
+			break // Context cancelled -- still persist what was already fetched
 		}
 
-		if m.processArticle(item, feedURL) {
-			newArticles++
+		if publishDate, ok := m.admitArticle(item, feedURL); ok {
+			admitted = append(admitted, admittedItem{item: item, publishDate: publishDate})
 		}
 	}
+	pending := m.fetchArticles(ctx, feedURL, admitted)
+
+	// Persist the feed's new articles in batched transactions instead of one
+	// auto-committed INSERT (and WAL flush) per article.
+	newArticles := m.persistArticles(feedURL, pending)
+
+	if err := ctx.Err(); err != nil {
+		return err
+	}
 
 	duration := time.Since(startTime)
 	m.logFetch(feedURL, "success", "", duration, totalArticles, newArticles)
@@ -336,71 +448,228 @@ func (m *RSSMonitor) processFeedItems(ctx context.Context, feedURL string, feed
 	return nil
 }
 
+// markStoredArticles marks as seen every item whose URL is already in the
+// articles table, using one `url = ANY($1)` query for the whole feed. Only
+// links missing from the in-memory seen set are sent. Normally that set mirrors
+// the table (see loadExistingArticles), but it can fall behind: the startup
+// load may fail, or another process (the backfill command, a second replica)
+// may insert rows. Without this check each such article would be re-fetched,
+// counted as new and re-summarized. On a query error the per-item in-memory
+// check still applies, so the fetch goes ahead as before.
+//
+// Items admitArticle will reject on date are left out too. They are never
+// saved and so never marked seen, and a feed's back catalogue of undated or
+// pre-cutoff items would otherwise be looked up on every fetch cycle forever.
+func (m *RSSMonitor) markStoredArticles(ctx context.Context, feedURL string, items []*gofeed.Item) {
+	m.mutex.RLock()
+	var unseen []string
+	for _, item := range items {
+		if item.Link == "" || m.seenArticles[item.Link] {
+			continue
+		}
+		if _, reject := m.checkPublishDate(item); reject == "" {
+			unseen = append(unseen, item.Link)
+		}
+	}
+	m.mutex.RUnlock()
+
+	if len(unseen) == 0 {
+		return
+	}
+
+	rows, err := m.db.QueryContext(ctx, `SELECT url FROM articles WHERE url = ANY($1)`, pq.Array(unseen))
+	if err != nil {
+		log.Printf("Feed %s: failed to check stored articles: %v", feedURL, err)
+		return
+	}
+	defer rows.Close()
+
+	var stored []string
+	for rows.Next() {
+		var url string
+		if err := rows.Scan(&url); err != nil {
+			log.Printf("Feed %s: error scanning stored article URL: %v", feedURL, err)
+			continue
+		}
+		stored = append(stored, url)
+	}
+	if err := rows.Err(); err != nil {
+		log.Printf("Feed %s: failed to check stored articles: %v", feedURL, err)
+		return
+	}
+
+	m.mutex.Lock()
+	for _, url := range stored {
+		m.seenArticles[url] = true
+	}
+	m.mutex.Unlock()
+}
+
+// checkPublishDate applies the publish-date filters shared by admitArticle and
+// markStoredArticles. It returns the item's UTC publish date and, if the item
+// is rejected, the articles_processed status naming why; an empty status means
+// the date is admissible.
+func (m *RSSMonitor) checkPublishDate(item *gofeed.Item) (time.Time, string) {
+	if item.PublishedParsed == nil {
+		return time.Time{}, "skipped_no_publish_date"
+	}
+	publishDate := item.PublishedParsed.UTC()
+	if publishDate.Before(m.config.App.ArticleCutoffDate.UTC()) {
+		return publishDate, "skipped_before_cutoff"
+	}
+	if publishDate.Before(m.config.App.InitiationDate) {
+		return publishDate, "skipped_before_initiation"
+	}
+	return publishDate, ""
+}
+
 // flareSolverrResponse models the subset of the FlareSolverr v1 API response we use.
 type flareSolverrResponse struct {
 	Status   string `json:"status"`
 	Message  string `json:"message"`
+	Session  string `json:"session"`
 	Solution struct {
 		Status   int    `json:"status"`
 		Response string `json:"response"`
 	} `json:"solution"`
 }
 
+// flareSessionTTLMinutes asks FlareSolverr to recycle a pooled session's
+// browser once it is this old, so long-lived sessions don't accumulate memory.
+const flareSessionTTLMinutes = 30
+
 // fetchViaFlareSolverr retries a blocked feed through a FlareSolverr instance,
 // which uses a headless browser to pass Cloudflare/WAF challenges. The browser
 // returns a rendered DOM, so the raw feed XML is extracted before parsing.
 func (m *RSSMonitor) fetchViaFlareSolverr(ctx context.Context, feedURL string, startTime time.Time) error {
 	log.Printf("Feed %s: HTTP 403, retrying via FlareSolverr", feedURL)
 
-	payload, err := json.Marshal(map[string]interface{}{
+	// Allow the solver its full maxTimeout plus headroom for browser startup.
+	reqCtx, cancel := context.WithTimeout(ctx, m.config.FlareSolverr.Timeout+30*time.Second)
+	defer cancel()
+
+	payload := map[string]interface{}{
 		"cmd":        "request.get",
 		"url":        feedURL,
 		"maxTimeout": int(m.config.FlareSolverr.Timeout / time.Millisecond),
-	})
+		// Only the feed text is wanted; skip the images, stylesheets and fonts
+		// the browser would otherwise download and lay out. Older FlareSolverr
+		// releases ignore the flag.
+		"disableMedia": true,
+	}
+	session := m.acquireFlareSession(reqCtx)
+	if session != "" {
+		payload["session"] = session
+		payload["session_ttl_minutes"] = flareSessionTTLMinutes
+	}
+
+	fsResp, err := m.flareCommand(reqCtx, payload)
+	m.releaseFlareSession(session, err == nil)
+	if err != nil {
+		return m.flareError(feedURL, startTime, err.Error())
+	}
+	if fsResp.Solution.Status != http.StatusOK {
+		return m.flareError(feedURL, startTime, fmt.Sprintf("solved with HTTP %d", fsResp.Solution.Status))
+	}
+
+	feed, err := gofeed.NewParser().ParseString(extractFeedXML(fsResp.Solution.Response))
 	if err != nil {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("marshal request: %v", err))
+		return m.flareError(feedURL, startTime, fmt.Sprintf("parse solved feed: %v", err))
 	}
 
-	// Allow the solver its full maxTimeout plus headroom for browser startup.
-	reqCtx, cancel := context.WithTimeout(ctx, m.config.FlareSolverr.Timeout+30*time.Second)
-	defer cancel()
+	log.Printf("Feed %s: solved via FlareSolverr (%d items)", feedURL, len(feed.Items))
+	return m.processFeedItems(ctx, feedURL, feed, startTime)
+}
+
+// flareCommand sends one command to the FlareSolverr v1 API and returns its
+// decoded response, treating any status other than "ok" as an error.
+func (m *RSSMonitor) flareCommand(ctx context.Context, payload map[string]interface{}) (*flareSolverrResponse, error) {
+	body, err := json.Marshal(payload)
+	if err != nil {
+		return nil, fmt.Errorf("marshal request: %v", err)
+	}
 
-	req, err := http.NewRequestWithContext(reqCtx, "POST", m.config.FlareSolverr.URL, bytes.NewReader(payload))
+	req, err := http.NewRequestWithContext(ctx, "POST", m.config.FlareSolverr.URL, bytes.NewReader(body))
 	if err != nil {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("create request: %v", err))
+		return nil, fmt.Errorf("create request: %v", err)
 	}
 	req.Header.Set("Content-Type", "application/json")
 
-	client := &http.Client{Timeout: m.config.FlareSolverr.Timeout + 30*time.Second}
-	resp, err := client.Do(req)
+	resp, err := m.flareClient.Do(req)
 	if err != nil {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("request failed: %v", err))
+		return nil, fmt.Errorf("request failed: %v", err)
 	}
 	defer resp.Body.Close()
 
 	raw, err := io.ReadAll(resp.Body)
 	if err != nil {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("read response: %v", err))
+		return nil, fmt.Errorf("read response: %v", err)
 	}
 
 	var fsResp flareSolverrResponse
 	if err := json.Unmarshal(raw, &fsResp); err != nil {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("decode response: %v", err))
+		return nil, fmt.Errorf("decode response: %v", err)
 	}
 	if fsResp.Status != "ok" {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("solver status %q: %s", fsResp.Status, fsResp.Message))
+		return nil, fmt.Errorf("solver status %q: %s", fsResp.Status, fsResp.Message)
 	}
-	if fsResp.Solution.Status != http.StatusOK {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("solved with HTTP %d", fsResp.Solution.Status))
+	return &fsResp, nil
+}
+
+// acquireFlareSession returns an idle pooled FlareSolverr session, creating a
+// new one if none is free. Without a session, FlareSolverr launches and tears
+// down a whole headless Chrome for every request, which costs seconds each
+// time. A session keeps that browser running. It also keeps the site's
+// challenge cookies (cf_clearance), so repeat fetches of the same feed often
+// skip the challenge entirely. Returns "" if session reuse is disabled
+// (FLARESOLVERR_MAX_IDLE_SESSIONS=0) or a session can't be created; the
+// caller then falls back to a one-off, session-less request.
+func (m *RSSMonitor) acquireFlareSession(ctx context.Context) string {
+	if cap(m.flareSessions) == 0 {
+		return ""
 	}
 
-	feed, err := m.parser.ParseString(extractFeedXML(fsResp.Solution.Response))
+	select {
+	case session := <-m.flareSessions:
+		return session
+	default:
+	}
+
+	fsResp, err := m.flareCommand(ctx, map[string]interface{}{"cmd": "sessions.create"})
 	if err != nil {
-		return m.flareError(feedURL, startTime, fmt.Sprintf("parse solved feed: %v", err))
+		log.Printf("FlareSolverr: failed to create session, using a one-off browser: %v", err)
+		return ""
 	}
+	return fsResp.Session
+}
 
-	log.Printf("Feed %s: solved via FlareSolverr (%d items)", feedURL, len(feed.Items))
-	return m.processFeedItems(ctx, feedURL, feed, startTime)
+// releaseFlareSession returns a session to the idle pool after use. Sessions
+// whose request failed are destroyed instead, in case their browser is wedged.
+// Sessions that don't fit in the pool are destroyed as well.
+func (m *RSSMonitor) releaseFlareSession(session string, healthy bool) {
+	if session == "" {
+		return
+	}
+	if healthy {
+		select {
+		case m.flareSessions <- session:
+			return
+		default:
+		}
+	}
+	m.destroyFlareSession(session)
+}
+
+// destroyFlareSession closes a FlareSolverr session's browser. It uses its own
+// short timeout so it still runs during shutdown, after the fetch context has
+// been cancelled.
+func (m *RSSMonitor) destroyFlareSession(session string) {
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+
+	if _, err := m.flareCommand(ctx, map[string]interface{}{"cmd": "sessions.destroy", "session": session}); err != nil {
+		log.Printf("FlareSolverr: failed to destroy session %s: %v", session, err)
+	}
 }
 
 // flareError centralises error logging and metrics for the FlareSolverr path.
@@ -453,36 +722,35 @@ func extractFeedXML(s string) string {
 	return trimmed
 }
 
-// processArticle processes a single article from an RSS feed
-func (m *RSSMonitor) processArticle(item *gofeed.Item, feedURL string) bool {
+// admittedItem is an RSS item that passed admitArticle, with its normalized
+// publish date.
+type admittedItem struct {
+	item        *gofeed.Item
+	publishDate time.Time
+}
+
+// admitArticle applies the link, publish-date and duplicate filters to a single
+// RSS item. If the item should be fetched, it is marked as seen and admitArticle
+// returns its UTC publish date and true.
+func (m *RSSMonitor) admitArticle(item *gofeed.Item, feedURL string) (time.Time, bool) {
 	if item.Link == "" {
 		m.metrics.RecordArticleProcessed(feedURL, "skipped_no_link")
-		return false
-	}
-
-	// Parse and normalize the publish date to UTC
-	var publishDate time.Time
-	if item.PublishedParsed != nil {
-		publishDate = item.PublishedParsed.UTC()
-	} else {
-		// If no publish date is available, skip the article as per requirements
-		log.Printf("Skipping article with missing publish date: %s", item.Title)
-		m.metrics.RecordArticleProcessed(feedURL, "skipped_no_publish_date")
-		return false
+		return time.Time{}, false
 	}
 
-	// Check publication date against the cutoff date — skip silently (metrics track these)
-	cutoffDate := m.config.App.ArticleCutoffDate.UTC()
-	if publishDate.Before(cutoffDate) {
-		m.metrics.RecordArticleFilteredPreCutoff(feedURL)
-		m.metrics.RecordArticleProcessed(feedURL, "skipped_before_cutoff")
-		return false
-	}
-
-	// Check publication date against initiation date
-	if publishDate.Before(m.config.App.InitiationDate) {
-		m.metrics.RecordArticleProcessed(feedURL, "skipped_before_initiation")
-		return false
+	// Check the publish date (normalized to UTC) against the cutoff and
+	// initiation dates — skip silently apart from metrics
+	publishDate, reject := m.checkPublishDate(item)
+	if reject != "" {
+		switch reject {
+		case "skipped_no_publish_date":
+			// If no publish date is available, skip the article as per requirements
+			log.Printf("Skipping article with missing publish date: %s", item.Title)
+		case "skipped_before_cutoff":
+			m.metrics.RecordArticleFilteredPreCutoff(feedURL)
+		}
+		m.metrics.RecordArticleProcessed(feedURL, reject)
+		return time.Time{}, false
 	}
 
 	// Article passed the cutoff date filter
@@ -494,12 +762,68 @@ func (m *RSSMonitor) processArticle(item *gofeed.Item, feedURL string) bool {
 	if m.seenArticles[item.Link] {
 		m.mutex.Unlock()
 		m.metrics.RecordArticleProcessed(feedURL, "skipped_duplicate")
-		return false // Already processed
+		return time.Time{}, false // Already processed
 	}
 	// Mark as seen immediately to prevent duplicate processing by concurrent goroutines
 	m.seenArticles[item.Link] = true
 	m.mutex.Unlock()
 
+	return publishDate, true
+}
+
+// fetchArticles fetches full content for a feed's admitted items, running at
+// most Performance.MaxConcurrentArticleFetches fetches at once. The returned
+// articles are in the same order as admitted, so batch inserts stay
+// chronological. Items skipped because ctx was cancelled are unmarked as seen,
+// so the next cycle picks them up again.
+func (m *RSSMonitor) fetchArticles(ctx context.Context, feedURL string, admitted []admittedItem) []Article {
+	articles := make([]Article, len(admitted))
+	fetched := make([]bool, len(admitted))
+
+	workers := m.config.Performance.MaxConcurrentArticleFetches
+	if workers < 1 {
+		workers = 1
+	}
+	semaphore := make(chan struct{}, workers)
+
+	var wg sync.WaitGroup
+	for i, a := range admitted {
+		wg.Add(1)
+		go func(i int, a admittedItem) {
+			defer wg.Done()
+
+			select {
+			case semaphore <- struct{}{}:
+				defer func() { <-semaphore }()
+			case <-ctx.Done():
+				return
+			}
+			if ctx.Err() != nil {
+				return
+			}
+
+			articles[i] = m.fetchArticle(a.item, feedURL, a.publishDate)
+			fetched[i] = true
+		}(i, a)
+	}
+	wg.Wait()
+
+	result := make([]Article, 0, len(admitted))
+	for i, a := range admitted {
+		if fetched[i] {
+			result = append(result, articles[i])
+			continue
+		}
+		m.mutex.Lock()
+		delete(m.seenArticles, a.item.Link)
+		m.mutex.Unlock()
+	}
+	return result
+}
+
+// fetchArticle fetches an admitted item's full content, falling back to the
+// feed's description on error, and builds the article to be saved.
+func (m *RSSMonitor) fetchArticle(item *gofeed.Item, feedURL string, publishDate time.Time) Article {
 	// Fetch full content with context for graceful shutdown
 	fetchCtx, fetchCancel := context.WithTimeout(context.Background(), m.config.API.Timeout)
 	defer fetchCancel()
@@ -525,21 +849,52 @@ func (m *RSSMonitor) processArticle(item *gofeed.Item, feedURL string) bool {
 	article.PublishedAt = publishDate
 
 	// Generate content hash for deduplication
-	article.ContentHash = m.generateContentHash(article.Title, article.URL, article.Content)
-
-	// Save to database
-	if err := m.saveArticle(article); err != nil {
-		log.Printf("Failed to save article %s: %v", article.URL, err)
-		m.metrics.RecordArticleProcessed(feedURL, "save_failed")
-		m.metrics.RecordArticleProcessedTotal("failed")
-		// Unmark on failure so it can be retried next cycle
-		m.mutex.Lock()
-		delete(m.seenArticles, item.Link)
-		m.mutex.Unlock()
-		return false
+	article.ContentHash = generateContentHash(article.Title, article.URL, article.Content)
+
+	return article
+}
+
+// persistArticles saves a feed's newly fetched articles, then records metrics
+// and enqueues summarization for each one saved. Rows are written in batches of
+// articleInsertBatchSize, one transaction per batch. A single bad row aborts
+// the whole PostgreSQL transaction, so a failed batch is retried row by row
+// rather than dropping every article in it. Returns the number saved.
+func (m *RSSMonitor) persistArticles(feedURL string, articles []Article) int {
+	saved := 0
+	for start := 0; start < len(articles); start += articleInsertBatchSize {
+		end := start + articleInsertBatchSize
+		if end > len(articles) {
+			end = len(articles)
+		}
+		batch := articles[start:end]
+
+		inserted, err := m.saveArticleBatch(batch)
+		if err != nil {
+			log.Printf("Batch save of %d articles from %s failed, retrying individually: %v", len(batch), feedURL, err)
+			for _, article := range batch {
+				ok, err := m.saveArticle(article)
+				if err != nil {
+					m.articleSaveFailed(feedURL, article, err)
+					continue
+				}
+				if m.articleStored(feedURL, article, ok) {
+					saved++
+				}
+			}
+			continue
+		}
+
+		for i, article := range batch {
+			if m.articleStored(feedURL, article, inserted[i]) {
+				saved++
+			}
+		}
 	}
+	return saved
+}
 
-	// Record successful processing
+// articleSaved records a successfully stored article and queues its summary.
+func (m *RSSMonitor) articleSaved(feedURL string, article Article) {
 	m.metrics.RecordArticleProcessed(feedURL, "processed")
 	m.metrics.RecordArticleProcessedTotal("success")
 
@@ -547,10 +902,95 @@ func (m *RSSMonitor) processArticle(item *gofeed.Item, feedURL string) bool {
 
 	// Try to generate summary for the new article
 	go m.generateSummaryAsync(article)
+}
 
+// articleStored records an article whose insert succeeded and reports
+// whether it was actually new. An insert the conflict clause skipped means
+// the row was already in the table — typically stored by a concurrent fetch
+// of another feed carrying the same link. That article stays marked as seen
+// and is neither counted nor queued for summarization again.
+func (m *RSSMonitor) articleStored(feedURL string, article Article, inserted bool) bool {
+	if !inserted {
+		m.metrics.RecordArticleProcessed(feedURL, "skipped_duplicate")
+		m.metrics.RecordArticleProcessedTotal("duplicate")
+		return false
+	}
+	m.articleSaved(feedURL, article)
 	return true
 }
 
+// articleSaveFailed records a failed save and unmarks the article so it is
+// retried on the next fetch cycle.
+func (m *RSSMonitor) articleSaveFailed(feedURL string, article Article, err error) {
+	log.Printf("Failed to save article %s: %v", article.URL, err)
+	m.metrics.RecordArticleProcessed(feedURL, "save_failed")
+	m.metrics.RecordArticleProcessedTotal("failed")
+	// Unmark on failure so it can be retried next cycle
+	m.mutex.Lock()
+	delete(m.seenArticles, article.URL)
+	m.mutex.Unlock()
+}
+
+// Selectors used by extractMainContent, compiled once at package load.
+// doc.Find(string) re-parses its selector on every call, and extraction runs
+// several of them per fetched article; FindMatcher with a precompiled
+// cascadia.Selector skips that work on the hot path.
+var (
+	// goquery's .Text() returns the raw source text of <script>/<style>
+	// elements too (they're unrendered but still DOM text nodes), so they're
+	// stripped before any text is measured. "#ar-widget" is a common "Listen
+	// to this article" audio-player plugin embedded inside the real content
+	// container, whose playback/voice-selector controls would otherwise be
+	// measured (and stored) as if they were article prose. theregister.com
+	// labels every ad slot with <span class="ad-label">REG AD</span>. One
+	// grouped selector removes all of them in a single traversal.
+	nonArticleMatcher = cascadia.MustCompile("script, style, #ar-widget, .ad-label")
+
+	// Precise, high-confidence article-body selectors. Within this tier the
+	// longest match wins (a real post body dwarfs a related-post teaser card;
+	// this is the hackread.com fix). ".k5a-article" is theregister.com's
+	// <section class="... k5a-article"> article body. Each tier is matched
+	// as one grouped selector, so it costs a single traversal rather than one
+	// per selector; every element matching any member is still compared.
+	preciseContentMatcher = newContentTier(
+		"article", ".post-content", ".entry-content", ".article-body", ".post-body", ".k5a-article")
+	// Broad page wrappers, used ONLY when no precise selector matched — some
+	// sites (Bootstrap admin themes like cvefeed.io) have no article/
+	// .entry-content wrapper at all. These must never override a precise match:
+	// on theregister.com .content/.page-content span the whole page (nav, ads,
+	// "more from" grids) and are far longer than the real story, so treating
+	// them as equals to precise selectors picked chrome over the article.
+	fallbackContentMatcher = newContentTier(".content", ".page-content", ".main-content")
+
+	mainMatcher = cascadia.MustCompile("main")
+	bodyMatcher = cascadia.MustCompile("body")
+)
+
+// contentTier is a priority-ordered list of content selectors, matched as a
+// single grouped selector.
+type contentTier struct {
+	all     cascadia.Sel
+	members []cascadia.Sel
+}
+
+func newContentTier(selectors ...string) contentTier {
+	tier := contentTier{all: cascadia.MustCompile(strings.Join(selectors, ", "))}
+	for _, selector := range selectors {
+		tier.members = append(tier.members, cascadia.MustCompile(selector))
+	}
+	return tier
+}
+
+// rank returns the index of the first selector in the tier that matches n.
+func (t contentTier) rank(n *html.Node) int {
+	for i, member := range t.members {
+		if member.Match(n) {
+			return i
+		}
+	}
+	return len(t.members)
+}
+
 // extractMainContent picks the best-matching element's text from a page.
 // Pages that include "related posts"/"latest articles" widgets often have
 // several elements matching a content-area selector (e.g. multiple <article>
@@ -569,71 +1009,62 @@ func (m *RSSMonitor) processArticle(item *gofeed.Item, feedURL string) bool {
 // in header/nav chrome (a search-box placeholder, a "Pricing" nav link)
 // ahead of the real per-page content.
 func extractMainContent(doc *goquery.Document) string {
-	// goquery's .Text() returns the raw source text of <script>/<style>
-	// elements too (they're unrendered but still DOM text nodes) — strip
-	// them first so CSS rules or JS don't leak into the stored article text.
-	doc.Find("script, style").Remove()
-
-	// Strip known non-article widgets before measuring/using any selector's
-	// text — e.g. "#ar-widget" is a common "Listen to this article"
-	// audio-player plugin embedded inside the real content container, whose
-	// own playback/voice-selector controls would otherwise be measured (and
-	// stored) as if they were article prose.
-	doc.Find("#ar-widget").Remove()
-
-	// theregister.com labels every ad slot with <span class="ad-label">REG AD</span>;
-	// strip them so ad-slot labels don't pollute the extracted article text.
-	doc.Find(".ad-label").Remove()
-
-	// Precise, high-confidence article-body selectors. Within this tier the
-	// longest match wins (a real post body dwarfs a related-post teaser card;
-	// this is the hackread.com fix). ".k5a-article" is theregister.com's
-	// <section class="... k5a-article"> article body.
-	preciseSelectors := []string{
-		"article",
-		".post-content",
-		".entry-content",
-		".article-body",
-		".post-body",
-		".k5a-article",
-	}
-	// Broad page wrappers, used ONLY when no precise selector matched — some
-	// sites (Bootstrap admin themes like cvefeed.io) have no article/
-	// .entry-content wrapper at all. These must never override a precise match:
-	// on theregister.com .content/.page-content span the whole page (nav, ads,
-	// "more from" grids) and are far longer than the real story, so treating
-	// them as equals to precise selectors picked chrome over the article.
-	fallbackSelectors := []string{
-		".content",
-		".page-content",
-		".main-content",
-	}
-
-	longest := func(selectors []string) string {
-		var content string
-		for _, selector := range selectors {
-			doc.Find(selector).Each(func(_ int, s *goquery.Selection) {
-				if text := s.Text(); len(text) > len(content) {
-					content = text
-				}
-			})
+	doc.FindMatcher(nonArticleMatcher).Remove()
+
+	// Candidates are compared by text length alone, and only the winner's
+	// text is built: nested matches (an <article> wrapping .entry-content)
+	// would otherwise each materialize a copy of the same article text.
+	// Equal lengths go to the earlier selector in the tier, then to the
+	// earlier element in the document.
+	longest := func(tier contentTier) string {
+		var best *html.Node
+		bestLen := 0
+		for _, node := range doc.FindMatcher(tier.all).Nodes {
+			n := textLen(node)
+			if n > bestLen || (n == bestLen && n > 0 && tier.rank(node) < tier.rank(best)) {
+				best, bestLen = node, n
+			}
+		}
+		if best == nil {
+			return ""
 		}
-		return content
+		return goquery.NewDocumentFromNode(best).Text()
 	}
 
-	content := longest(preciseSelectors)
+	content := longest(preciseContentMatcher)
 	if content == "" {
-		content = longest(fallbackSelectors)
+		content = longest(fallbackContentMatcher)
 	}
 	if content == "" {
-		content = doc.Find("main").First().Text()
+		content = doc.FindMatcher(mainMatcher).First().Text()
 	}
 	if content == "" {
-		content = doc.Find("body").Text()
+		content = doc.FindMatcher(bodyMatcher).Text()
 	}
 	return content
 }
 
+// textLen returns len(Selection.Text()) for a single node — the byte length
+// of all its descendant text nodes — without building the string.
+func textLen(n *html.Node) int {
+	if n.Type == html.TextNode {
+		return len(n.Data)
+	}
+	total := 0
+	for c := n.FirstChild; c != nil; c = c.NextSibling {
+		total += textLen(c)
+	}
+	return total
+}
+
+// maxArticleHTMLBytes caps how much of an article page is handed to the HTML
+// parser. goquery builds a full DOM node for everything it reads. Some pages
+// ship megabytes of inline hydration JSON or base64 assets after the article
+// body, which cost parse time and memory for text that extractMainContent
+// strips anyway. The parser closes any elements left open at the cut, and the
+// extracted text is truncated to MaxArticleContentLength regardless.
+const maxArticleHTMLBytes = 4 << 20
+
 // fetchFullContent attempts to fetch the full content of an article
 func (m *RSSMonitor) fetchFullContent(ctx context.Context, url string) (string, error) {
 	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
@@ -647,14 +1078,14 @@ func (m *RSSMonitor) fetchFullContent(ctx context.Context, url string) (string,
 	if err != nil {
 		return "", err
 	}
-	defer resp.Body.Close()
+	defer drainAndClose(resp.Body)
 
 	if resp.StatusCode != http.StatusOK {
 		return "", fmt.Errorf("HTTP %d", resp.StatusCode)
 	}
 
 	// Parse HTML and extract text content
-	doc, err := goquery.NewDocumentFromReader(resp.Body)
+	doc, err := goquery.NewDocumentFromReader(io.LimitReader(resp.Body, maxArticleHTMLBytes))
 	if err != nil {
 		return "", err
 	}
@@ -669,26 +1100,43 @@ func (m *RSSMonitor) fetchFullContent(ctx context.Context, url string) (string,
 	return content, nil
 }
 
-// generateContentHash creates a unique hash for content deduplication
-func (m *RSSMonitor) generateContentHash(title, url, content string) string {
-	hasher := sha256.New()
-	hasher.Write([]byte(title))
-	hasher.Write([]byte(url))
-	hasher.Write([]byte(content))
-	return hex.EncodeToString(hasher.Sum(nil))
+// generateContentHash creates a unique hash for content deduplication: the
+// SHA-256 of title, URL and content concatenated. The fields are copied into
+// one exactly-sized buffer and hashed with sha256.Sum256 rather than streamed
+// through three hasher.Write([]byte(...)) calls — that made a separate copy
+// of each string plus a heap-allocated hasher per article. The digest is
+// byte-for-byte the same, so hashes already stored in content_hash still match.
+func generateContentHash(title, url, content string) string {
+	buf := make([]byte, 0, len(title)+len(url)+len(content))
+	buf = append(buf, title...)
+	buf = append(buf, url...)
+	buf = append(buf, content...)
+	sum := sha256.Sum256(buf)
+	return hex.EncodeToString(sum[:])
 }
 
-// saveArticle saves an article to the database
-func (m *RSSMonitor) saveArticle(article Article) error {
-	query := `
+// articleInsertBatchSize caps how many articles saveArticleBatch writes in one
+// transaction, so an unusually large feed doesn't hold a single transaction
+// open for its entire item list.
+const articleInsertBatchSize = 1000
+
+// insertArticleQuery is shared by the single-row and batched save paths. The
+// conflict clause is untargeted so a violation of either unique constraint
+// (url, content_hash) is skipped and reported as zero rows affected instead
+// of aborting the row — and with it the whole batch transaction. Since
+// content_hash covers the URL, in practice conflicts arrive on url.
+const insertArticleQuery = `
 		INSERT INTO articles (title, url, full_content, publish_date, fetch_duration_ms, feed_url, content_hash, fetch_time, posted_to_discord)
 		VALUES ($1, $2, $3, $4, $5, $6, $7, NOW(), FALSE)
-		ON CONFLICT (url) DO NOTHING`
-
-	// Strip any invalid UTF-8 before insert: a single bad byte makes PostgreSQL
-	// reject the whole row ("invalid byte sequence for encoding UTF8"), silently
-	// dropping the article. Covers both truncation- and source-induced bad bytes.
-	_, err := m.db.Exec(query,
+		ON CONFLICT DO NOTHING`
+
+// articleInsertArgs returns the insertArticleQuery arguments for an article.
+//
+// Strip any invalid UTF-8 before insert: a single bad byte makes PostgreSQL
+// reject the whole row ("invalid byte sequence for encoding UTF8"), silently
+// dropping the article. Covers both truncation- and source-induced bad bytes.
+func articleInsertArgs(article Article) []interface{} {
+	return []interface{}{
 		sanitizeUTF8(article.Title),
 		sanitizeUTF8(article.URL),
 		sanitizeUTF8(article.Content),
@@ -696,12 +1144,95 @@ func (m *RSSMonitor) saveArticle(article Article) error {
 		article.FetchDuration.Milliseconds(),
 		sanitizeUTF8(article.FeedURL),
 		article.ContentHash,
-	)
+	}
+}
 
-	return err
+// saveArticle saves an article to the database
+func (m *RSSMonitor) saveArticle(article Article) (bool, error) {
+	stmt, err := m.prepare(insertArticleQuery)
+	if err != nil {
+		return false, err
+	}
+	result, err := stmt.Exec(articleInsertArgs(article)...)
+	if err != nil {
+		return false, err
+	}
+	return rowInserted(result)
+}
+
+// rowInserted reports whether a single-row INSERT ... ON CONFLICT DO NOTHING
+// actually wrote its row.
+func rowInserted(result sql.Result) (bool, error) {
+	n, err := result.RowsAffected()
+	if err != nil {
+		return false, err
+	}
+	return n > 0, nil
+}
+
+// saveArticleBatch saves articles in a single transaction with one prepared
+// statement, so the batch costs one commit instead of one per article. It is
+// all-or-nothing: any failed row rolls back the whole batch. On success,
+// inserted[i] reports whether articles[i] was written or skipped as a
+// duplicate by the conflict clause.
+func (m *RSSMonitor) saveArticleBatch(articles []Article) (inserted []bool, err error) {
+	if len(articles) == 0 {
+		return nil, nil
+	}
+
+	prepared, err := m.prepare(insertArticleQuery)
+	if err != nil {
+		return nil, err
+	}
+
+	tx, err := m.db.Begin()
+	if err != nil {
+		return nil, fmt.Errorf("failed to begin transaction: %w", err)
+	}
+	defer tx.Rollback()
+
+	stmt := tx.Stmt(prepared)
+	defer stmt.Close()
+
+	inserted = make([]bool, len(articles))
+	for i, article := range articles {
+		result, err := stmt.Exec(articleInsertArgs(article)...)
+		if err == nil {
+			inserted[i], err = rowInserted(result)
+		}
+		if err != nil {
+			return nil, fmt.Errorf("failed to insert article %d (%s): %w", i, article.URL, err)
+		}
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("failed to commit transaction: %w", err)
+	}
+	return inserted, nil
+}
+
+// insertFetchLogQuery records one feed fetch attempt in fetch_logs.
+const insertFetchLogQuery = `
+		INSERT INTO fetch_logs (feed_url, status, message, duration_ms, articles_found, new_articles)
+		VALUES ($1, $2, $3, $4, $5, $6)`
+
+// fetchLogQueueSize bounds how many fetch_logs rows can wait for the
+// background writer before logFetch falls back to writing inline.
+const fetchLogQueueSize = 256
+
+// fetchLogEntry is one queued fetch_logs row.
+type fetchLogEntry struct {
+	feedURL       string
+	status        string
+	message       string
+	duration      time.Duration
+	articlesFound int
+	newArticles   int
 }
 
-// logFetch logs fetch operations to database and stdout
+// logFetch logs fetch operations to stdout and queues them for the database.
+// The fetch_logs insert is written by fetchLogWriter, so a feed fetch — and
+// in particular a failing one — does not wait on a database round trip.
 func (m *RSSMonitor) logFetch(feedURL, status, message string, duration time.Duration, articlesFound, newArticles int) {
 	// Log to stdout
 	logMsg := fmt.Sprintf("Feed: %s | Status: %s | Duration: %v | Articles: %d | New: %d",
@@ -713,14 +1244,79 @@ func (m *RSSMonitor) logFetch(feedURL, status, message string, duration time.Dur
 
 	log.Println(logMsg)
 
-	// Log to database
-	query := `
-		INSERT INTO fetch_logs (feed_url, status, message, duration_ms, articles_found, new_articles)
-		VALUES ($1, $2, $3, $4, $5, $6)`
+	entry := fetchLogEntry{feedURL, status, message, duration, articlesFound, newArticles}
+	select {
+	case m.fetchLogs <- entry:
+	default:
+		// Writer is backed up; write inline rather than drop the row
+		m.writeFetchLogs([]fetchLogEntry{entry})
+	}
+}
+
+// fetchLogWriter writes queued fetch logs until Close closes the queue. Rows
+// that piled up while a write was in progress go out together in one
+// transaction.
+func (m *RSSMonitor) fetchLogWriter() {
+	defer close(m.fetchLogDone)
+
+	batch := make([]fetchLogEntry, 0, fetchLogQueueSize)
+	for entry := range m.fetchLogs {
+		batch = append(batch[:0], entry)
+		for drained := false; !drained && len(batch) < fetchLogQueueSize; {
+			select {
+			case entry, ok := <-m.fetchLogs:
+				if !ok {
+					drained = true
+					continue
+				}
+				batch = append(batch, entry)
+			default:
+				drained = true
+			}
+		}
+		m.writeFetchLogs(batch)
+	}
+}
 
-	_, err := m.db.Exec(query, feedURL, status, message, duration.Milliseconds(), articlesFound, newArticles)
+// writeFetchLogs inserts entries into fetch_logs, in one transaction when
+// there is more than one. A single bad row aborts the whole PostgreSQL
+// transaction, so a failed batch is retried row by row rather than dropping
+// every entry in it.
+func (m *RSSMonitor) writeFetchLogs(entries []fetchLogEntry) {
+	prepared, err := m.prepare(insertFetchLogQuery)
 	if err != nil {
-		log.Printf("Failed to log fetch to database: %v", err)
+		log.Printf("Failed to log %d fetch(es) to database: %v", len(entries), err)
+		return
+	}
+
+	if len(entries) > 1 {
+		err := func() error {
+			tx, err := m.db.Begin()
+			if err != nil {
+				return fmt.Errorf("failed to begin transaction: %w", err)
+			}
+			defer tx.Rollback()
+
+			stmt := tx.Stmt(prepared)
+			defer stmt.Close()
+
+			for _, e := range entries {
+				if _, err := stmt.Exec(e.feedURL, e.status, e.message, e.duration.Milliseconds(), e.articlesFound, e.newArticles); err != nil {
+					return err
+				}
+			}
+			return tx.Commit()
+		}()
+		if err == nil {
+			return
+		}
+		log.Printf("Batch log of %d fetches failed, retrying individually: %v", len(entries), err)
+	}
+
+	for _, e := range entries {
+		if _, err := prepared.Exec(e.feedURL, e.status, e.message, e.duration.Milliseconds(), e.articlesFound, e.newArticles); err != nil {
+			log.Printf("Failed to log fetch of %s to database: %v", e.feedURL, err)
+		}
 	}
 }
 
@@ -758,7 +1354,10 @@ func (m *RSSMonitor) generateSummaryAsync(article Article) {
 
 // updateArticleSummary updates the summary field for an article in the database
 func (m *RSSMonitor) updateArticleSummary(articleURL, summary string) error {
-	query := `UPDATE articles SET summary = $1, updated_at = NOW() WHERE url = $2`
-	_, err := m.db.Exec(query, summary, articleURL)
+	stmt, err := m.prepare(`UPDATE articles SET summary = $1, updated_at = NOW() WHERE url = $2`)
+	if err != nil {
+		return err
+	}
+	_, err = stmt.Exec(summary, articleURL)
 	return err
 }
@@ -1,10 +1,19 @@
 package main
 
 import (
+	"errors"
+	"information-broker/config"
+	"io"
+	"net"
+	"net/url"
+	"os"
 	"strings"
+	"syscall"
 	"testing"
+	"time"
 
 	"github.com/PuerkitoBio/goquery"
+	"github.com/mmcdole/gofeed"
 )
 
 func TestExtractMainContentPrefersLongestArticleMatch(t *testing.T) {
@@ -62,6 +71,26 @@ func TestExtractMainContentPrefersLongerMatchFromLaterSelector(t *testing.T) {
 	}
 }
 
+func TestExtractMainContentBreaksTiesBySelectorPriority(t *testing.T) {
+	// Both candidates have the same text length; the one matching the
+	// earlier selector in the tier wins even though it comes later in the
+	// document.
+	html := `<html><body>
+		<div class="post-body">Body text BBBB.</div>
+		<div class="entry-content">Body text AAAA.</div>
+	</body></html>`
+
+	doc, err := goquery.NewDocumentFromReader(strings.NewReader(html))
+	if err != nil {
+		t.Fatalf("parse: %v", err)
+	}
+
+	got := extractMainContent(doc)
+	if got != "Body text AAAA." {
+		t.Fatalf("expected the .entry-content match to win the tie, got: %q", got)
+	}
+}
+
 func TestExtractMainContentStripsAudioPlayerWidget(t *testing.T) {
 	// Real-world case found live: hackread.com's actual post body is wrapped
 	// in .entry-content, but that same container's FIRST child is a
@@ -196,3 +225,109 @@ func TestExtractMainContentTheRegisterK5aArticle(t *testing.T) {
 		t.Fatalf("extracted a teaser card instead of the article body: %.120q", got)
 	}
 }
+
+func TestIsSolvableTransportError(t *testing.T) {
+	// Wrapped the way net/http actually returns dial failures:
+	// *url.Error -> *net.OpError -> (DNS error | *os.SyscallError -> Errno).
+	dialErr := func(inner error) error {
+		return &url.Error{Op: "Get", URL: "https://example.com/feed", Err: &net.OpError{Op: "dial", Net: "tcp", Err: inner}}
+	}
+
+	tests := []struct {
+		name string
+		err  error
+		want bool
+	}{
+		{"unresolvable host", dialErr(&net.DNSError{Err: "no such host", Name: "example.invalid", IsNotFound: true}), false},
+		{"connection refused", dialErr(os.NewSyscallError("connect", syscall.ECONNREFUSED)), false},
+		{"host unreachable", dialErr(os.NewSyscallError("connect", syscall.EHOSTUNREACH)), false},
+		{"connection reset (WAF drop)", dialErr(os.NewSyscallError("read", syscall.ECONNRESET)), true},
+		{"unexpected EOF during handshake", &url.Error{Op: "Get", URL: "https://example.com/feed", Err: io.EOF}, true},
+		{"opaque error", errors.New("stream error: stream ID 1; INTERNAL_ERROR"), true},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := isSolvableTransportError(tt.err); got != tt.want {
+				t.Errorf("isSolvableTransportError(%v) = %v, want %v", tt.err, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestGenerateContentHash(t *testing.T) {
+	// Pinned digests: content_hash values already in the database were
+	// produced by the original streaming implementation, so the output
+	// must stay identical to sha256(title + url + content).
+	tests := []struct {
+		title, url, content string
+		want                string
+	}{
+		{"Patch Tuesday", "https://example.com/a", "Body text", "30c857255c6ff0dc5b3edc3afa2c7fc375ea6a3e606b0a165d36af18af406e7e"},
+		{"", "", "", "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"},
+	}
+	for _, tt := range tests {
+		if got := generateContentHash(tt.title, tt.url, tt.content); got != tt.want {
+			t.Errorf("generateContentHash(%q, %q, %q) = %s, want %s", tt.title, tt.url, tt.content, got, tt.want)
+		}
+	}
+}
+
+func TestSortItemsByPublishDate(t *testing.T) {
+	at := func(day int) *time.Time {
+		d := time.Date(2026, 1, day, 0, 0, 0, 0, time.UTC)
+		return &d
+	}
+	items := []*gofeed.Item{
+		{Link: "undated-1"},
+		{Link: "jan-3", PublishedParsed: at(3)},
+		{Link: "jan-1", PublishedParsed: at(1)},
+		{Link: "undated-2"},
+		{Link: "jan-2a", PublishedParsed: at(2)},
+		{Link: "jan-2b", PublishedParsed: at(2)},
+	}
+
+	got := sortItemsByPublishDate(items)
+
+	want := []string{"jan-1", "jan-2a", "jan-2b", "jan-3", "undated-1", "undated-2"}
+	for i, item := range got {
+		if item.Link != want[i] {
+			t.Fatalf("position %d = %s, want %s (full order %v)", i, item.Link, want[i], want)
+		}
+	}
+	if items[0].Link != "undated-1" {
+		t.Errorf("input slice was reordered")
+	}
+}
+
+func TestCheckPublishDate(t *testing.T) {
+	cutoff := time.Date(2026, 1, 10, 0, 0, 0, 0, time.UTC)
+	initiation := cutoff.AddDate(0, 0, 5)
+	m := &RSSMonitor{config: &config.Config{App: config.AppConfig{
+		ArticleCutoffDate: cutoff,
+		InitiationDate:    initiation,
+	}}}
+	at := func(ts time.Time) *time.Time { return &ts }
+
+	tests := []struct {
+		name string
+		item *gofeed.Item
+		want string
+	}{
+		{"undated", &gofeed.Item{}, "skipped_no_publish_date"},
+		{"before cutoff", &gofeed.Item{PublishedParsed: at(cutoff.Add(-time.Second))}, "skipped_before_cutoff"},
+		{"before initiation", &gofeed.Item{PublishedParsed: at(cutoff)}, "skipped_before_initiation"},
+		{"at initiation", &gofeed.Item{PublishedParsed: at(initiation)}, ""},
+		{"after initiation in another zone", &gofeed.Item{PublishedParsed: at(initiation.Add(time.Hour).In(time.FixedZone("EST", -5*3600)))}, ""},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			publishDate, reject := m.checkPublishDate(tt.item)
+			if reject != tt.want {
+				t.Errorf("checkPublishDate() reject = %q, want %q", reject, tt.want)
+			}
+			if tt.item.PublishedParsed != nil && publishDate.Location() != time.UTC {
+				t.Errorf("checkPublishDate() date %v is not UTC", publishDate)
+			}
+		})
+	}
+}
@@ -53,14 +53,20 @@ type SummarizationScheduler struct {
 	totalErrors    int64
 	isRunning      bool
 
-	// Worker state
-	currentRequest   *SummarizationRequest
-	requestStartTime time.Time
+	// Worker state: the request each busy worker is processing, by worker ID
+	inFlight map[int]inFlightRequest
+}
+
+// inFlightRequest is a request a worker is currently processing.
+type inFlightRequest struct {
+	request   SummarizationRequest
+	startTime time.Time
 }
 
 // SummarizationSchedulerConfig holds configuration for the scheduler
 type SummarizationSchedulerConfig struct {
 	MaxQueueSize      int           `env:"SUMMARIZATION_MAX_QUEUE_SIZE" default:"100"`
+	Workers           int           `env:"SUMMARIZATION_WORKERS" default:"1"`
 	WorkerTimeout     time.Duration `env:"SUMMARIZATION_WORKER_TIMEOUT" default:"120s"`
 	MaxRetries        int           `env:"SUMMARIZATION_MAX_RETRIES" default:"3"`
 	RetryBackoffBase  time.Duration `env:"SUMMARIZATION_RETRY_BACKOFF_BASE" default:"1s"`
@@ -92,6 +98,7 @@ func NewSummarizationScheduler(db *sql.DB, cfg *config.Config, metrics *Promethe
 		shutdown:      make(chan struct{}),
 		done:          make(chan struct{}),
 		queueDepth:    0,
+		inFlight:      make(map[int]inFlightRequest),
 	}
 
 	// Initialize metrics with queue capacity
@@ -104,6 +111,7 @@ func NewSummarizationScheduler(db *sql.DB, cfg *config.Config, metrics *Promethe
 func loadSchedulerConfig(cfg *config.Config) SummarizationSchedulerConfig {
 	return SummarizationSchedulerConfig{
 		MaxQueueSize:      cfg.Summarization.MaxQueueSize,
+		Workers:           cfg.Summarization.Workers,
 		WorkerTimeout:     cfg.Summarization.WorkerTimeout,
 		MaxRetries:        cfg.Summarization.MaxRetries,
 		RetryBackoffBase:  cfg.Summarization.RetryBackoffBase,
@@ -122,10 +130,25 @@ func (s *SummarizationScheduler) Start(ctx context.Context) error {
 	s.isRunning = true
 	s.mu.Unlock()
 
-	log.Println("Starting summarization scheduler with single worker")
+	workers := loadSchedulerConfig(s.config).Workers
+	if workers < 1 {
+		workers = 1
+	}
+	log.Printf("Starting summarization scheduler with %d worker(s)", workers)
 
-	// Start the single worker goroutine
-	go s.worker(ctx)
+	// Start the worker goroutines; done closes once all of them have exited
+	var wg sync.WaitGroup
+	for id := 0; id < workers; id++ {
+		wg.Add(1)
+		go func(id int) {
+			defer wg.Done()
+			s.worker(ctx, id)
+		}(id)
+	}
+	go func() {
+		wg.Wait()
+		close(s.done)
+	}()
 
 	// Start metrics collection goroutine
 	go s.metricsCollector(ctx)
@@ -147,7 +170,7 @@ func (s *SummarizationScheduler) Stop() error {
 	// Signal shutdown
 	close(s.shutdown)
 
-	// Wait for worker to finish
+	// Wait for workers to finish
 	select {
 	case <-s.done:
 		log.Println("Summarization scheduler stopped gracefully")
@@ -223,35 +246,36 @@ func (s *SummarizationScheduler) EnqueueSummarizationSync(request SummarizationR
 	}
 }
 
-// worker is the single worker goroutine that processes requests sequentially
-func (s *SummarizationScheduler) worker(ctx context.Context) {
-	defer close(s.done)
-
+// worker processes requests from the queue one at a time. With the default of
+// one worker, requests are handled strictly sequentially; with more, each
+// worker keeps one Ollama request in flight, which only pays off if the Ollama
+// server is allowed to run that many in parallel (OLLAMA_NUM_PARALLEL).
+func (s *SummarizationScheduler) worker(ctx context.Context, id int) {
 	config := loadSchedulerConfig(s.config)
-	log.Printf("Summarization worker started with timeout: %v", config.WorkerTimeout)
+	log.Printf("Summarization worker %d started with timeout: %v", id, config.WorkerTimeout)
 
 	for {
 		select {
 		case <-ctx.Done():
-			log.Println("Summarization worker stopping due to context cancellation")
+			log.Printf("Summarization worker %d stopping due to context cancellation", id)
 			return
 
 		case <-s.shutdown:
-			log.Println("Summarization worker stopping due to shutdown signal")
+			log.Printf("Summarization worker %d stopping due to shutdown signal", id)
 			return
 
 		case request := <-s.queue:
+			startTime := time.Now()
 			s.mu.Lock()
 			s.queueDepth--
-			s.currentRequest = &request
-			s.requestStartTime = time.Now()
+			s.inFlight[id] = inFlightRequest{request: request, startTime: startTime}
 			s.mu.Unlock()
 
 			// Process the request with timeout
 			response := s.processRequest(ctx, request, config)
 
 			// Calculate wait time and record metrics
-			waitTime := s.requestStartTime.Sub(request.EnqueuedAt)
+			waitTime := startTime.Sub(request.EnqueuedAt)
 			s.metrics.RecordSummarizationQueueWait(request.Model, waitTime)
 
 			// Record processing metrics
@@ -267,7 +291,7 @@ func (s *SummarizationScheduler) worker(ctx context.Context) {
 			if response.Error != nil {
 				s.totalErrors++
 			}
-			s.currentRequest = nil
+			delete(s.inFlight, id)
 			s.mu.Unlock()
 
 			// Send response if channel is provided
@@ -395,21 +419,22 @@ func (s *SummarizationScheduler) metricsCollector(ctx context.Context) {
 func (s *SummarizationScheduler) updateMetrics() {
 	s.mu.RLock()
 	queueDepth := s.queueDepth
-	currentRequest := s.currentRequest
-	requestStartTime := s.requestStartTime
+	inFlight := make([]inFlightRequest, 0, len(s.inFlight))
+	for _, r := range s.inFlight {
+		inFlight = append(inFlight, r)
+	}
 	s.mu.RUnlock()
 
 	// Update queue depth metric
 	s.metrics.UpdateSummarizationQueueDepth(queueDepth)
 
 	// Log current state for debugging
-	log.Printf("Summarization scheduler metrics - Queue depth: %d, Processing: %v",
-		queueDepth, currentRequest != nil)
+	log.Printf("Summarization scheduler metrics - Queue depth: %d, Processing: %d",
+		queueDepth, len(inFlight))
 
-	if currentRequest != nil {
-		processingDuration := time.Since(requestStartTime)
+	for _, r := range inFlight {
 		log.Printf("Current request processing time: %v for article: %s",
-			processingDuration, currentRequest.ArticleTitle)
+			time.Since(r.startTime), r.request.ArticleTitle)
 	}
 }
 
@@ -576,12 +601,20 @@ func (s *SummarizationScheduler) GetStats() map[string]interface{} {
 		"total_processed": s.totalProcessed,
 		"total_errors":    s.totalErrors,
 		"is_running":      s.isRunning,
-		"current_request": s.currentRequest != nil,
+		"current_request": len(s.inFlight) > 0,
+		"in_flight":       len(s.inFlight),
 	}
 
-	if s.currentRequest != nil {
-		stats["current_request_article"] = s.currentRequest.ArticleTitle
-		stats["current_request_duration"] = time.Since(s.requestStartTime).String()
+	// With several workers busy, report the longest-running request
+	var oldest inFlightRequest
+	for _, r := range s.inFlight {
+		if oldest.startTime.IsZero() || r.startTime.Before(oldest.startTime) {
+			oldest = r
+		}
+	}
+	if len(s.inFlight) > 0 {
+		stats["current_request_article"] = oldest.request.ArticleTitle
+		stats["current_request_duration"] = time.Since(oldest.startTime).String()
 	}
 
 	return stats
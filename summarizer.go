@@ -3,7 +3,9 @@ package main
 import (
 	"bytes"
 	"context"
+	"crypto/sha256"
 	"database/sql"
+	"encoding/hex"
 	"encoding/json"
 	"fmt"
 	"information-broker/config"
@@ -22,6 +24,9 @@ type SummaryRequest struct {
 	Model  string `json:"model"`
 	Prompt string `json:"prompt"`
 	Stream bool   `json:"stream"`
+	// KeepAlive is how long, in seconds, Ollama keeps the model loaded after
+	// this request (-1 = indefinitely). See ollamaKeepAlive.
+	KeepAlive int64 `json:"keep_alive"`
 }
 
 // SummaryResponse represents the response from OLLAMA API
@@ -57,13 +62,23 @@ func NewArticleSummarizer(db *sql.DB, cfg *config.Config, metrics *PrometheusMet
 	return &ArticleSummarizer{
 		db: db,
 		httpClient: &http.Client{
-			Timeout: cfg.OLLAMA.Timeout,
+			Timeout:   cfg.OLLAMA.Timeout,
+			Transport: ollamaTransport(cfg.Summarization.Workers),
 		},
 		config:  cfg,
 		metrics: metrics,
 	}
 }
 
+// ollamaTransport keeps one idle connection to Ollama per scheduler worker.
+// http.DefaultTransport keeps only two per host, so with more workers than
+// that, every request beyond the second would dial a fresh connection.
+func ollamaTransport(workers int) *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConnsPerHost = max(workers, t.MaxIdleConnsPerHost, http.DefaultMaxIdleConnsPerHost)
+	return t
+}
+
 // SummarizeArticle generates a concise summary of the article text using OLLAMA
 // It handles retries with exponential backoff and logs all operations to PostgreSQL
 func (s *ArticleSummarizer) SummarizeArticle(ctx context.Context, articleText, articleURL, model string) (string, error) {
@@ -81,6 +96,23 @@ func (s *ArticleSummarizer) SummarizeArticle(ctx context.Context, articleText, a
 	// Create the prompt for summarization
 	prompt := s.createSummaryPrompt(articleText)
 
+	// Republished and syndicated articles carry the same text under another
+	// URL; reuse the summary already generated for that exact prompt.
+	promptHash := summaryPromptHash(model, prompt)
+	if summary, ok := s.cachedSummary(ctx, promptHash, model); ok {
+		s.logSummaryOperation(SummaryLog{
+			ArticleURL:   articleURL,
+			Model:        model,
+			Status:       "cached",
+			Summary:      summary,
+			Duration:     time.Since(startTime),
+			RetryAttempt: 0,
+			CreatedAt:    time.Now(),
+		})
+		log.Printf("Reused cached summary for article %s with model %s", articleURL, model)
+		return summary, nil
+	}
+
 	var lastErr error
 
 	// Retry logic with exponential backoff
@@ -105,6 +137,8 @@ func (s *ArticleSummarizer) SummarizeArticle(ctx context.Context, articleText, a
 			// Record successful metrics
 			s.metrics.RecordSummaryAPI(model, "success", attemptDuration)
 
+			s.cacheSummary(ctx, promptHash, model, summary)
+
 			log.Printf("Successfully summarized article %s with model %s (attempt %d/%d)",
 				articleURL, model, attempt, s.config.OLLAMA.MaxRetries)
 			return summary, nil
@@ -174,9 +208,10 @@ Summary:`, maxSummaryLength, articleText)
 func (s *ArticleSummarizer) callOllamaAPI(ctx context.Context, prompt, model string) (string, error) {
 	// Prepare request payload
 	reqPayload := SummaryRequest{
-		Model:  model,
-		Prompt: prompt,
-		Stream: false, // We want the complete response, not streaming
+		Model:     model,
+		Prompt:    prompt,
+		Stream:    false, // We want the complete response, not streaming
+		KeepAlive: ollamaKeepAlive(s.config.OLLAMA.KeepAlive),
 	}
 
 	jsonData, err := json.Marshal(reqPayload)
@@ -241,6 +276,52 @@ func (s *ArticleSummarizer) callOllamaAPI(ctx context.Context, prompt, model str
 	return summary, nil
 }
 
+// ollamaKeepAlive converts the configured OLLAMA.KeepAlive into the keep_alive
+// value of an Ollama request: whole seconds, or -1 (never unload) for any
+// negative duration. Ollama's own default unloads the model after 5 minutes
+// idle. That is shorter than a typical RSS fetch interval, so each cycle's
+// first summary paid a full model reload.
+func ollamaKeepAlive(d time.Duration) int64 {
+	if d < 0 {
+		return -1
+	}
+	return int64(d / time.Second)
+}
+
+// summaryPromptHash keys the summary cache. It hashes the full prompt rather
+// than just the article text, so a change to the prompt template or to
+// MAX_SUMMARY_LENGTH never serves a summary generated under the old one.
+func summaryPromptHash(model, prompt string) string {
+	sum := sha256.Sum256([]byte(model + "\x00" + prompt))
+	return hex.EncodeToString(sum[:])
+}
+
+// cachedSummary returns the summary previously generated for promptHash, if any.
+// A lookup error is treated as a miss.
+func (s *ArticleSummarizer) cachedSummary(ctx context.Context, promptHash, model string) (string, bool) {
+	var summary string
+	err := s.db.QueryRowContext(ctx, `SELECT summary FROM summary_cache WHERE prompt_hash = $1 AND model = $2`,
+		promptHash, model).Scan(&summary)
+	if err != nil {
+		if err != sql.ErrNoRows {
+			log.Printf("Failed to read summary cache: %v", err)
+		}
+		return "", false
+	}
+	return summary, true
+}
+
+// cacheSummary stores a successfully generated summary for reuse.
+func (s *ArticleSummarizer) cacheSummary(ctx context.Context, promptHash, model, summary string) {
+	query := `
+		INSERT INTO summary_cache (prompt_hash, model, summary, created_at)
+		VALUES ($1, $2, $3, NOW())
+		ON CONFLICT (prompt_hash, model) DO UPDATE SET summary = EXCLUDED.summary, created_at = EXCLUDED.created_at`
+	if _, err := s.db.ExecContext(ctx, query, promptHash, model, summary); err != nil {
+		log.Printf("Failed to write summary cache: %v", err)
+	}
+}
+
 // handleSummaryFailure handles the case when all retry attempts fail
 func (s *ArticleSummarizer) handleSummaryFailure(articleURL, model, errorMsg string, attempts int, startTime time.Time) (string, error) {
 	const fallbackSummary = "summary unavailable"
@@ -289,7 +370,7 @@ func (s *ArticleSummarizer) logSummaryOperation(logEntry SummaryLog) {
 	}
 }
 
-// InitializeSummaryTables creates the necessary database tables for summary logging
+// InitializeSummaryTables creates the necessary database tables for summary logging and caching
 func InitializeSummaryTables(db *sql.DB) error {
 	query := `
 		CREATE TABLE IF NOT EXISTS summary_logs (
@@ -322,6 +403,21 @@ func InitializeSummaryTables(db *sql.DB) error {
 		}
 	}
 
+	// Generated summaries keyed by prompt hash, so identical article text
+	// (republished or syndicated under another URL) is not summarized twice
+	cacheQuery := `
+		CREATE TABLE IF NOT EXISTS summary_cache (
+			prompt_hash TEXT NOT NULL,
+			model TEXT NOT NULL,
+			summary TEXT NOT NULL,
+			created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+			PRIMARY KEY (prompt_hash, model)
+		)`
+
+	if _, err := db.Exec(cacheQuery); err != nil {
+		return fmt.Errorf("failed to create summary_cache table: %w", err)
+	}
+
 	return nil
 }
 
@@ -0,0 +1,44 @@
+package main
+
+import (
+	"testing"
+	"time"
+)
+
+func TestOllamaKeepAlive(t *testing.T) {
+	tests := []struct {
+		name string
+		in   time.Duration
+		want int64
+	}{
+		{"negative keeps the model loaded indefinitely", -1, -1},
+		{"large negative also maps to -1", -30 * time.Minute, -1},
+		{"zero unloads immediately", 0, 0},
+		{"whole seconds", 30 * time.Minute, 1800},
+		{"sub-second remainder is dropped", 1500 * time.Millisecond, 1},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := ollamaKeepAlive(tt.in); got != tt.want {
+				t.Errorf("ollamaKeepAlive(%v) = %d, want %d", tt.in, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestSummaryPromptHash(t *testing.T) {
+	base := summaryPromptHash("llama3", "Summarize: body")
+	if got := summaryPromptHash("llama3", "Summarize: body"); got != base {
+		t.Errorf("same model and prompt hashed differently: %s vs %s", got, base)
+	}
+	if summaryPromptHash("mistral", "Summarize: body") == base {
+		t.Errorf("different model shares a cache key")
+	}
+	if summaryPromptHash("llama3", "Summarize: other body") == base {
+		t.Errorf("different prompt shares a cache key")
+	}
+	// The separator keeps the model/prompt boundary unambiguous
+	if summaryPromptHash("llama3S", "ummarize: body") == base {
+		t.Errorf("model/prompt boundary is ambiguous")
+	}
+}